@@ -21,6 +21,20 @@ class CostSharing: # pylint: disable=R0904
             storage: CostStorage implementation (e.g., DatabaseCostStorage)
         """
         self._storage = storage
+        # Request-scoped cache of authorized groups keyed by (group_id, user_id).
+        # Cleared at every request boundary (see _begin_request) so one service
+        # request never re-fetches the same group for repeated authorization.
+        self._group_cache = {}
+
+    def _begin_request(self):
+        """
+        Mark a request boundary.
+
+        Each public service method represents one request; clearing the group
+        cache here guarantees no state leaks between requests while repeated
+        authorization checks within a request reuse the cached group.
+        """
+        self._group_cache.clear()
 
     def get_user_by_id(self, user_id):
         """
@@ -99,6 +113,31 @@ class CostSharing: # pylint: disable=R0904
             GroupNotFoundError: If group doesn't exist
             ForbiddenError: If user is not a member of the group
         """
+        self._begin_request()
+        return self._get_group_authorized(group_id, user_id)
+
+    def _get_group_authorized(self, group_id, user_id):
+        """
+        Get group by ID with membership check, memoized per request.
+
+        Repeated calls with the same (group_id, user_id) within one request
+        return the cached group instead of hitting storage again.
+
+        Args:
+            group_id: Group ID
+            user_id: User ID of the requesting user
+
+        Returns:
+            Group object with creator and members populated
+
+        Raises:
+            GroupNotFoundError: If group doesn't exist
+            ForbiddenError: If user is not a member of the group
+        """
+        cached_group = self._group_cache.get((group_id, user_id))
+        if cached_group is not None:
+            return cached_group
+
         group = self._storage.get_group_by_id(group_id)
 
         if group is None:
@@ -108,8 +147,46 @@ class CostSharing: # pylint: disable=R0904
         if user_id not in user_ids:
             raise ForbiddenError("You do not have access to this group")
 
+        self._group_cache[(group_id, user_id)] = group
         return group
 
+    def _authorize_member(self, group_id, user_id):
+        """
+        Verify the user is a member of the group without loading the member list.
+
+        The membership probe is a single indexed lookup; only on a miss is the
+        group fetched to distinguish a missing group from a non-member.
+
+        Args:
+            group_id: Group ID
+            user_id: User ID of the requesting user
+
+        Raises:
+            GroupNotFoundError: If group doesn't exist
+            ForbiddenError: If user is not a member of the group
+        """
+        if self._storage.is_member(group_id, user_id):
+            return
+        if self._storage.get_group_by_id(group_id) is None:
+            raise GroupNotFoundError(f"Group with ID {group_id} not found")
+        raise ForbiddenError("You do not have access to this group")
+
+    def group_has_member(self, group_id, user_id):
+        """
+        Check whether a user is a member of a group.
+
+        Unlike get_group_by_id, this does not load the whole member list -
+        it is a single membership lookup in storage.
+
+        Args:
+            group_id: Group ID
+            user_id: User ID to check
+
+        Returns:
+            True if the user is a member of the group, False otherwise
+        """
+        return self._storage.is_member(group_id, user_id)
+
     def add_group_member(self, group_id, caller_user_id, user):
         """
         Add a member to a group by email. Creates user account if user doesn't exist.
@@ -127,8 +204,10 @@ class CostSharing: # pylint: disable=R0904
             ForbiddenError: If caller is not a member of the group
             ConflictError: If user is already a member of the group
         """
+        self._begin_request()
+
         # Verify caller is a member (raises GroupNotFoundError or ForbiddenError if invalid)
-        group = self.get_group_by_id(group_id, caller_user_id)
+        group = self._get_group_authorized(group_id, caller_user_id)
 
         # Get or create the user
         new_user = self.get_or_create_user(user)
@@ -163,8 +242,10 @@ class CostSharing: # pylint: disable=R0904
             ConflictError: If caller is not authorized to remove this member,
                 or if member is involved in expenses
         """
+        self._begin_request()
+
         # Verify caller is a member (raises GroupNotFoundError or ForbiddenError if invalid)
-        group = self.get_group_by_id(group_id, caller_user_id)
+        group = self._get_group_authorized(group_id, caller_user_id)
 
         # Verify the user to remove is a member of the group
         member_ids = [member.id for member in group.members]
@@ -213,8 +294,10 @@ class CostSharing: # pylint: disable=R0904
             ForbiddenError: If user is not a member of the group
             ConflictError: If group has existing expenses
         """
+        self._begin_request()
+
         # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        self.get_group_by_id(group_id, user_id)
+        self._authorize_member(group_id, user_id)
 
         # Check if group has any expenses
         expenses = self._storage.get_group_expenses(group_id)
@@ -239,18 +322,14 @@ class CostSharing: # pylint: disable=R0904
             GroupNotFoundError: If group doesn't exist
             ForbiddenError: If user is not a member of the group
         """
-        # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        self.get_group_by_id(group_id, user_id)
+        self._begin_request()
 
-        # Get expenses from storage
-        expenses = self._storage.get_group_expenses(group_id)
-
-        # Calculate per_person_amount for each expense
-        for expense in expenses:
-            num_participants = len(expense.split_between)
-            expense.per_person_amount = round(expense.amount / num_participants, 2)
+        # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
+        self._authorize_member(group_id, user_id)
 
-        return expenses
+        # Get expenses from storage (per_person_amount is computed by the
+        # database as a generated column)
+        return self._storage.get_group_expenses(group_id)
 
     def _validate_expense_request(self, participant_ids, user_id, group):
         """
@@ -282,16 +361,6 @@ class CostSharing: # pylint: disable=R0904
                 "All users in splitBetween must be members of the group"
             )
 
-    def _calculate_per_person_amount(self, expense):
-        """
-        Calculate and set per_person_amount on an expense.
-
-        Args:
-            expense: Expense object with amount and split_between populated
-        """
-        num_participants = len(expense.split_between)
-        expense.per_person_amount = round(expense.amount / num_participants, 2)
-
     def create_expense(self, expense):
         """
         Create a new expense in a group.
@@ -309,21 +378,19 @@ class CostSharing: # pylint: disable=R0904
             ValidationError: If validation fails (user not in splitBetween, 
                 invalid participants, etc.)
         """
+        self._begin_request()
+
         # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        group = self.get_group_by_id(expense.group_id, expense.paid_by_user_id)
+        group = self._get_group_authorized(expense.group_id, expense.paid_by_user_id)
 
         # Validate expense request
         self._validate_expense_request(
             expense.participant_user_ids, expense.paid_by_user_id, group
         )
 
-        # Create expense in storage layer
-        created_expense = self._storage.create_expense(expense)
-
-        # Calculate per_person_amount
-        self._calculate_per_person_amount(created_expense)
-
-        return created_expense
+        # Create expense in storage layer (per_person_amount is computed by
+        # the database as a generated column)
+        return self._storage.create_expense(expense)
 
     def get_expense_by_id(self, expense_id, group_id, user_id):
         """
@@ -342,8 +409,10 @@ class CostSharing: # pylint: disable=R0904
             GroupNotFoundError: If group doesn't exist
             ForbiddenError: If user is not a member of the group
         """
+        self._begin_request()
+
         # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        self.get_group_by_id(group_id, user_id)
+        self._authorize_member(group_id, user_id)
 
         # Get expense from storage
         expense = self._storage.get_expense_by_id(expense_id)
@@ -355,10 +424,6 @@ class CostSharing: # pylint: disable=R0904
         if expense.group_id != group_id:
             raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
 
-        # Calculate per_person_amount
-        num_participants = len(expense.split_between)
-        expense.per_person_amount = round(expense.amount / num_participants, 2)
-
         return expense
 
     def update_expense(self, expense_id, group_id, user_id, expense):
@@ -382,38 +447,29 @@ class CostSharing: # pylint: disable=R0904
             ValidationError: If validation fails (user not in splitBetween,
                 invalid participants, etc.)
         """
-        # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        group = self.get_group_by_id(group_id, user_id)
-
-        # Get existing expense
-        existing_expense = self._storage.get_expense_by_id(expense_id)
-
-        if existing_expense is None:
-            raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
+        self._begin_request()
 
-        # Verify expense belongs to the group
-        if existing_expense.group_id != group_id:
-            raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
+        # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
+        self._get_group_authorized(group_id, user_id)
 
-        # Verify user is the payer (authorization check)
-        if existing_expense.paid_by.id != user_id:
-            raise ForbiddenError(
-                "Only the person who paid for this expense can modify it"
-            )
+        # Check group and payer with a lightweight lookup - the full expense
+        # is read back by the storage layer after the update anyway
+        self._check_expense_group_and_payer(
+            expense_id, group_id, user_id,
+            "Only the person who paid for this expense can modify it"
+        )
 
-        # Validate expense request
+        # Validate expense request (the group comes from the request-scoped
+        # cache, so this does not hit storage a second time)
+        group = self._get_group_authorized(group_id, user_id)
         self._validate_expense_request(
             expense.participant_user_ids, user_id, group
         )
 
-        # Update expense in storage layer
+        # Update expense in storage layer (per_person_amount is computed by
+        # the database as a generated column)
         # Note: paid_by_user_id is not updated (remains the same)
-        updated_expense = self._storage.update_expense(expense_id, expense)
-
-        # Calculate per_person_amount
-        self._calculate_per_person_amount(updated_expense)
-
-        return updated_expense
+        return self._storage.update_expense(expense_id, expense)
 
     def delete_expense(self, expense_id, group_id, user_id):
         """
@@ -429,24 +485,48 @@ class CostSharing: # pylint: disable=R0904
             GroupNotFoundError: If group doesn't exist
             ForbiddenError: If user is not a member of the group or not the payer
         """
+        self._begin_request()
+
         # Verify authorization (raises GroupNotFoundError or ForbiddenError if invalid)
-        self.get_group_by_id(group_id, user_id)
+        self._authorize_member(group_id, user_id)
 
-        # Get existing expense
-        existing_expense = self._storage.get_expense_by_id(expense_id)
+        # Check group and payer with a lightweight lookup - no need to
+        # materialize the payer and participants just to delete
+        self._check_expense_group_and_payer(
+            expense_id, group_id, user_id,
+            "Only the person who paid for this expense can delete it"
+        )
 
-        if existing_expense is None:
-            raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
+        # Delete expense in storage layer
+        self._storage.delete_expense(expense_id)
 
-        # Verify expense belongs to the group
-        if existing_expense.group_id != group_id:
+    def _check_expense_group_and_payer(self, expense_id, group_id, user_id, forbidden_message):
+        """
+        Verify an expense exists, belongs to the group, and was paid by the user.
+
+        Uses the lightweight group-and-payer lookup instead of loading the
+        full expense with payer and participants.
+
+        Args:
+            expense_id: Expense ID
+            group_id: Group ID the expense must belong to
+            user_id: User ID that must be the payer
+            forbidden_message: Message for the ForbiddenError if not the payer
+
+        Raises:
+            ExpenseNotFoundError: If expense doesn't exist or isn't in the group
+            ForbiddenError: If the user is not the payer
+        """
+        info = self._storage.get_expense_group_and_payer(expense_id)
+
+        if info is None:
             raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
 
-        # Verify user is the payer (authorization check)
-        if existing_expense.paid_by.id != user_id:
-            raise ForbiddenError(
-                "Only the person who paid for this expense can delete it"
-            )
+        expense_group_id, payer_id = info
 
-        # Delete expense in storage layer
-        self._storage.delete_expense(expense_id)
+        # An expense in a different group is reported as not found
+        if expense_group_id != group_id:
+            raise ExpenseNotFoundError(f"Expense with ID {expense_id} not found")
+
+        if payer_id != user_id:
+            raise ForbiddenError(forbidden_message)
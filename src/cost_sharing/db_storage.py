@@ -1,5 +1,6 @@
 """Database storage implementation using sqlite3"""
 
+import json
 import sqlite3
 
 from cost_sharing.models import (
@@ -8,6 +9,119 @@ from cost_sharing.models import (
 from cost_sharing.exceptions import StorageException
 
 
+# SQL statements, defined once at module scope. sqlite3 caches prepared
+# statements per connection keyed by the SQL text, so every call site reuses
+# the same (already hashed and interned) string object.
+_SQL_GET_USER_BY_EMAIL = 'SELECT id, email, name FROM users WHERE email = ?'
+
+_SQL_CREATE_USER = 'INSERT INTO users (email, name) VALUES (?, ?)'
+
+_SQL_GET_USER_BY_ID = 'SELECT id, email, name FROM users WHERE id = ?'
+
+_SQL_GET_USER_GROUPS = '''
+    SELECT g.id, g.name, g.description,
+           creator.id as creator_id, creator.email as creator_email,
+           creator.name as creator_name,
+           member.id as member_id, member.email as member_email,
+           member.name as member_name
+    FROM groups g
+    INNER JOIN users creator ON g.created_by_user_id = creator.id
+    INNER JOIN group_members gm ON gm.group_id = g.id
+    INNER JOIN users member ON gm.user_id = member.id
+    WHERE g.id IN (
+        SELECT group_id FROM group_members WHERE user_id = ?
+    )
+    ORDER BY g.id, member.id
+    '''
+
+# The SELECT guard makes the insert a no-op (rowcount 0) when the creator
+# doesn't exist, replacing a separate existence query
+_SQL_INSERT_GROUP = (
+    'INSERT INTO groups (name, description, created_by_user_id) '
+    'SELECT ?, ?, id FROM users WHERE id = ?'
+)
+
+_SQL_ADD_GROUP_MEMBER = 'INSERT INTO group_members (group_id, user_id) VALUES (?, ?)'
+
+# The correlated subquery aggregates the members into a JSON array so the
+# group, its creator, and its member list come back in one round trip
+_SQL_GET_GROUP_BY_ID = '''
+    SELECT g.id, g.name, g.description, g.created_by_user_id,
+           creator.id as creator_id, creator.email as creator_email,
+           creator.name as creator_name,
+           (SELECT json_group_array(json_object('id', id, 'email', email, 'name', name))
+            FROM (SELECT u.id AS id, u.email AS email, u.name AS name
+                  FROM group_members gm
+                  INNER JOIN users u ON gm.user_id = u.id
+                  WHERE gm.group_id = g.id
+                  ORDER BY u.id)) as members_json
+    FROM groups g
+    INNER JOIN users creator ON g.created_by_user_id = creator.id
+    WHERE g.id = ?
+    '''
+
+_SQL_IS_MEMBER = 'SELECT 1 FROM group_members WHERE group_id = ? AND user_id = ? LIMIT 1'
+
+_SQL_DELETE_GROUP_MEMBER = 'DELETE FROM group_members WHERE group_id = ? AND user_id = ?'
+
+_SQL_DELETE_GROUP = 'DELETE FROM groups WHERE id = ?'
+
+# Shared SELECT body for expense reads: payer columns joined in and the
+# participants aggregated into a JSON array per expense (same pattern as
+# _SQL_GET_GROUP_BY_ID), so every expense read is a single round trip
+_SQL_EXPENSE_SELECT = '''
+    SELECT e.id, e.group_id, e.description, e.amount, e.expense_date,
+           e.per_person_amount,
+           payer.id as payer_id, payer.email as payer_email, payer.name as payer_name,
+           (SELECT json_group_array(json_object('id', id, 'email', email, 'name', name))
+            FROM (SELECT u.id AS id, u.email AS email, u.name AS name
+                  FROM expense_participants ep
+                  INNER JOIN users u ON ep.user_id = u.id
+                  WHERE ep.expense_id = e.id
+                  ORDER BY u.id)) as participants_json
+    FROM expenses e
+    INNER JOIN users payer ON e.paid_by_user_id = payer.id'''
+
+_SQL_GET_GROUP_EXPENSES = _SQL_EXPENSE_SELECT + '''
+    WHERE e.group_id = ?
+    ORDER BY e.expense_date, e.id
+    '''
+
+# Keyset-paginated variant of _SQL_GET_GROUP_EXPENSES: the row-value
+# comparison continues after the last (date, id) seen, so each page is an
+# index range scan on (group_id, expense_date, id) - no rows are scanned and
+# discarded the way OFFSET would
+_SQL_GET_GROUP_EXPENSES_PAGE = _SQL_EXPENSE_SELECT + '''
+    WHERE e.group_id = ? AND (e.expense_date, e.id) > (?, ?)
+    ORDER BY e.expense_date, e.id
+    LIMIT ?
+    '''
+
+_SQL_INSERT_EXPENSE = (
+    'INSERT INTO expenses (group_id, description, amount, expense_date, '
+    'paid_by_user_id, participant_count) VALUES (?, ?, ?, ?, ?, ?)'
+)
+
+_SQL_ADD_EXPENSE_PARTICIPANT = \
+    'INSERT INTO expense_participants (expense_id, user_id) VALUES (?, ?)'
+
+_SQL_GET_EXPENSE_GROUP_AND_PAYER = \
+    'SELECT group_id, paid_by_user_id FROM expenses WHERE id = ?'
+
+_SQL_GET_EXPENSE_BY_ID = _SQL_EXPENSE_SELECT + '''
+    WHERE e.id = ?
+    '''
+
+_SQL_UPDATE_EXPENSE = (
+    'UPDATE expenses SET description = ?, amount = ?, expense_date = ?, '
+    'participant_count = ? WHERE id = ?'
+)
+
+_SQL_DELETE_EXPENSE_PARTICIPANTS = 'DELETE FROM expense_participants WHERE expense_id = ?'
+
+_SQL_DELETE_EXPENSE = 'DELETE FROM expenses WHERE id = ?'
+
+
 class DatabaseCostStorage: # pylint: disable=R0904
     """
     Database storage implementation using sqlite3.
@@ -29,6 +143,20 @@ class DatabaseCostStorage: # pylint: disable=R0904
         # Enable foreign key constraints
         self._conn.execute('PRAGMA foreign_keys = ON')
 
+        # Users are immutable in this schema (there is no update or delete
+        # path), so positive lookups are cached for the life of the storage.
+        # Negative lookups are never cached - get_or_create_user depends on a
+        # miss turning into a hit right after create_user.
+        self._users_by_id = {}
+        self._users_by_email = {}
+
+    def _cache_user(self, user):
+        """
+        Private helper to remember a user in both lookup caches.
+        """
+        self._users_by_id[user.id] = user
+        self._users_by_email[user.email] = user
+
     def get_user_by_email(self, email):
         """
         Get user by email address.
@@ -42,15 +170,21 @@ class DatabaseCostStorage: # pylint: disable=R0904
         Raises:
             StorageException: If a database error occurs
         """
+        cached_user = self._users_by_email.get(email)
+        if cached_user is not None:
+            return cached_user
+
         try:
             cursor = self._conn.execute(
-                'SELECT id, email, name FROM users WHERE email = ?',
+                _SQL_GET_USER_BY_EMAIL,
                 (email,)
             )
             row = cursor.fetchone()
             if row is None:
                 return None
-            return User(id=row['id'], email=row['email'], name=row['name'])
+            user = User(id=row['id'], email=row['email'], name=row['name'])
+            self._cache_user(user)
+            return user
         except sqlite3.Error as e:
             raise StorageException(f"Database error retrieving user by email: {e}") from e
 
@@ -69,17 +203,52 @@ class DatabaseCostStorage: # pylint: disable=R0904
             (including IntegrityError for duplicate email)
         """
         try:
-            cursor = self._conn.execute(
-                'INSERT INTO users (email, name) VALUES (?, ?)',
-                (user.email, user.name)
-            )
-            self._conn.commit()
-            user_id = cursor.lastrowid
-            return User(id=user_id, email=user.email, name=user.name)
+            with self._conn:
+                cursor = self._conn.execute(
+                    _SQL_CREATE_USER,
+                    (user.email, user.name)
+                )
+            created_user = User(id=cursor.lastrowid, email=user.email, name=user.name)
+            self._cache_user(created_user)
+            return created_user
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error creating user: {e}") from e
 
+    def create_users(self, users):
+        """
+        Create several users in one transaction.
+
+        The whole batch commits once instead of once per user; cursor
+        lastrowid is collected per insert because executemany does not
+        report row IDs.
+
+        Args:
+            users: Iterable of UserRequest objects with email and name
+
+        Returns:
+            List of newly created User objects, in input order
+
+        Raises:
+            StorageException: If a database error occurs (the whole batch is
+            rolled back)
+        """
+        try:
+            created_users = []
+            with self._conn:
+                for user in users:
+                    cursor = self._conn.execute(
+                        _SQL_CREATE_USER,
+                        (user.email, user.name)
+                    )
+                    created_users.append(
+                        User(id=cursor.lastrowid, email=user.email, name=user.name))
+            # Cache only after the transaction committed
+            for created_user in created_users:
+                self._cache_user(created_user)
+            return created_users
+        except sqlite3.Error as e:
+            raise StorageException(f"Database error creating users: {e}") from e
+
     def get_user_by_id(self, user_id):
         """
         Get user by ID.
@@ -93,15 +262,21 @@ class DatabaseCostStorage: # pylint: disable=R0904
         Raises:
             StorageException: If a database error occurs
         """
+        cached_user = self._users_by_id.get(user_id)
+        if cached_user is not None:
+            return cached_user
+
         try:
             cursor = self._conn.execute(
-                'SELECT id, email, name FROM users WHERE id = ?',
+                _SQL_GET_USER_BY_ID,
                 (user_id,)
             )
             row = cursor.fetchone()
             if row is None:
                 return None
-            return User(id=row['id'], email=row['email'], name=row['name'])
+            user = User(id=row['id'], email=row['email'], name=row['name'])
+            self._cache_user(user)
+            return user
         except sqlite3.Error as e:
             raise StorageException(f"Database error retrieving user by ID: {e}") from e
 
@@ -119,62 +294,33 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            group_rows = self._get_groups_with_creator_info(user_id)
+            # Single query joining groups, creators, and members - one row per
+            # (group, member) pair - instead of one members query per group
+            cursor = self._conn.execute(
+                _SQL_GET_USER_GROUPS,
+                (user_id,)
+            )
             groups = []
-            for row in group_rows:
-                members = self._get_group_members(row['id'])
-                creator = self._build_creator_from_row(row)
-                groups.append(Group(
-                    id=row['id'],
-                    name=row['name'],
-                    description=row['description'] or '',
-                    created_by=creator,
-                    members=members
+            for row in cursor.fetchall():
+                # Rows are ordered by group ID, so a new group starts whenever
+                # the ID changes
+                if not groups or groups[-1].id != row['id']:
+                    groups.append(Group(
+                        id=row['id'],
+                        name=row['name'],
+                        description=row['description'] or '',
+                        created_by=self._build_creator_from_row(row),
+                        members=[]
+                    ))
+                groups[-1].members.append(User(
+                    id=row['member_id'],
+                    email=row['member_email'],
+                    name=row['member_name']
                 ))
             return groups
         except sqlite3.Error as e:
             raise StorageException(f"Database error retrieving user groups: {e}") from e
 
-    def _get_groups_with_creator_info(self, user_id):
-        """
-        Private helper to get all groups (with creator info) a user belongs to.
-        """
-        cursor = self._conn.execute(
-            '''
-            SELECT g.id, g.name, g.description, g.created_by_user_id,
-                   creator.id as creator_id, creator.email as creator_email,
-                   creator.name as creator_name
-            FROM groups g
-            INNER JOIN users creator ON g.created_by_user_id = creator.id
-            WHERE g.id IN (
-                SELECT group_id FROM group_members WHERE user_id = ?
-            )
-            ORDER BY g.id
-            ''',
-            (user_id,)
-        )
-        return cursor.fetchall()
-
-    def _get_group_members(self, group_id):
-        """
-        Private helper to get all users who are members of the given group.
-        """
-        members_cursor = self._conn.execute(
-            '''
-            SELECT u.id, u.email, u.name
-            FROM group_members gm
-            INNER JOIN users u ON gm.user_id = u.id
-            WHERE gm.group_id = ?
-            ORDER BY u.id
-            ''',
-            (group_id,)
-        )
-        member_rows = members_cursor.fetchall()
-        return [
-            User(id=member_row['id'], email=member_row['email'], name=member_row['name'])
-            for member_row in member_rows
-        ]
-
     def _build_creator_from_row(self, row):
         """
         Private helper to build a User object for the creator from a group row.
@@ -198,17 +344,22 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            # Get creator information
+            # One explicit transaction for the group row and the creator
+            # membership (committed on success, rolled back on error)
+            with self._conn:
+                group_id = self._insert_group(
+                    group.name, group.description, group.created_by_user_id)
+                if group_id is None:
+                    # The SELECT guard inserted nothing: the creator doesn't
+                    # exist. This should not happen if business logic is
+                    # correct, but handle gracefully
+                    raise StorageException(
+                        f"User with ID {group.created_by_user_id} not found")
+                # Add creator as member
+                self._add_group_member(group_id, group.created_by_user_id)
+
+            # Get creator information for the return value
             creator = self.get_user_by_id(group.created_by_user_id)
-            if creator is None:
-                # This should not happen if business logic is correct, but handle gracefully
-                raise StorageException(f"User with ID {group.created_by_user_id} not found")
-
-            # Insert group
-            group_id = self._insert_group(group.name, group.description, group.created_by_user_id)
-            # Add creator as member
-            self._add_group_member(group_id, group.created_by_user_id)
-            self._conn.commit()
 
             return Group(
                 id=group_id,
@@ -218,17 +369,22 @@ class DatabaseCostStorage: # pylint: disable=R0904
                 members=[creator]
             )
         except sqlite3.Error as e:
-            self._conn.rollback()
+            # The connection context manager has already rolled back
             raise StorageException(f"Database error creating group: {e}") from e
 
     def _insert_group(self, name, description, user_id):
         """
         Private helper to insert a new group and return its id.
+
+        Returns None when nothing was inserted (the creator doesn't exist,
+        so the SELECT guard in the INSERT matched no rows).
         """
         cursor = self._conn.execute(
-            'INSERT INTO groups (name, description, created_by_user_id) VALUES (?, ?, ?)',
+            _SQL_INSERT_GROUP,
             (name, description, user_id)
         )
+        if cursor.rowcount == 0:
+            return None
         return cursor.lastrowid
 
     def _add_group_member(self, group_id, user_id):
@@ -236,7 +392,7 @@ class DatabaseCostStorage: # pylint: disable=R0904
         Private helper to add a user as a member to a group.
         """
         self._conn.execute(
-            'INSERT INTO group_members (group_id, user_id) VALUES (?, ?)',
+            _SQL_ADD_GROUP_MEMBER,
             (group_id, user_id)
         )
 
@@ -255,21 +411,18 @@ class DatabaseCostStorage: # pylint: disable=R0904
         """
         try:
             cursor = self._conn.execute(
-                '''
-                SELECT g.id, g.name, g.description, g.created_by_user_id,
-                       creator.id as creator_id, creator.email as creator_email,
-                       creator.name as creator_name
-                FROM groups g
-                INNER JOIN users creator ON g.created_by_user_id = creator.id
-                WHERE g.id = ?
-                ''',
+                _SQL_GET_GROUP_BY_ID,
                 (group_id,)
             )
             row = cursor.fetchone()
             if row is None:
                 return None
 
-            members = self._get_group_members(group_id)
+            # Decode the JSON member array aggregated by the query
+            members = [
+                User(id=member['id'], email=member['email'], name=member['name'])
+                for member in json.loads(row['members_json'])
+            ]
             creator = self._build_creator_from_row(row)
             return Group(
                 id=row['id'],
@@ -281,6 +434,31 @@ class DatabaseCostStorage: # pylint: disable=R0904
         except sqlite3.Error as e:
             raise StorageException(f"Database error retrieving group by ID: {e}") from e
 
+    def is_member(self, group_id, user_id):
+        """
+        Check whether a user is a member of a group.
+
+        Uses a single indexed lookup instead of loading the whole member list.
+
+        Args:
+            group_id: Group ID
+            user_id: User ID
+
+        Returns:
+            True if the user is a member of the group, False otherwise
+
+        Raises:
+            StorageException: If a database error occurs
+        """
+        try:
+            cursor = self._conn.execute(
+                _SQL_IS_MEMBER,
+                (group_id, user_id)
+            )
+            return cursor.fetchone() is not None
+        except sqlite3.Error as e:
+            raise StorageException(f"Database error checking membership: {e}") from e
+
     def add_group_member(self, group_id, user_id):
         """
         Add a user as a member to a group.
@@ -296,16 +474,42 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            self._conn.execute(
-                'INSERT INTO group_members (group_id, user_id) VALUES (?, ?)',
-                (group_id, user_id)
-            )
-            self._conn.commit()
+            with self._conn:
+                self._conn.execute(
+                    _SQL_ADD_GROUP_MEMBER,
+                    (group_id, user_id)
+                )
             return True
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error adding member: {e}") from e
 
+    def add_group_members(self, group_id, user_ids):
+        """
+        Add several users as members to a group in one transaction.
+
+        Uses a single executemany instead of one INSERT round trip per user.
+
+        Args:
+            group_id: Group ID
+            user_ids: Iterable of user IDs to add
+
+        Returns:
+            True if all members were added successfully
+
+        Raises:
+            StorageException: If a database error occurs (the whole batch is
+            rolled back)
+        """
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    _SQL_ADD_GROUP_MEMBER,
+                    [(group_id, user_id) for user_id in user_ids]
+                )
+            return True
+        except sqlite3.Error as e:
+            raise StorageException(f"Database error adding members: {e}") from e
+
     def delete_group_member(self, group_id, user_id):
         """
         Delete a user as a member from a group.
@@ -318,13 +522,12 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            self._conn.execute(
-                'DELETE FROM group_members WHERE group_id = ? AND user_id = ?',
-                (group_id, user_id)
-            )
-            self._conn.commit()
+            with self._conn:
+                self._conn.execute(
+                    _SQL_DELETE_GROUP_MEMBER,
+                    (group_id, user_id)
+                )
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error deleting member: {e}") from e
 
     def delete_group(self, group_id):
@@ -341,13 +544,12 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            self._conn.execute(
-                'DELETE FROM groups WHERE id = ?',
-                (group_id,)
-            )
-            self._conn.commit()
+            with self._conn:
+                self._conn.execute(
+                    _SQL_DELETE_GROUP,
+                    (group_id,)
+                )
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error deleting group: {e}") from e
 
     def get_group_expenses(self, group_id):
@@ -365,72 +567,80 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            # Get all expenses for the group with paidBy user info
-            expense_rows = self._get_expenses_with_payer_info(group_id)
-            expenses = []
-            for row in expense_rows:
-                # Get participants for this expense
-                participants = self._get_expense_participants(row['id'])
-                # Build paidBy user
-                payer = User(
-                    id=row['payer_id'],
-                    email=row['payer_email'],
-                    name=row['payer_name']
-                )
-                # Build Expense object
-                expenses.append(Expense(
-                    id=row['id'],
-                    group_id=row['group_id'],
-                    description=row['description'],
-                    amount=float(row['amount']),
-                    date=row['expense_date'],
-                    paid_by=payer,
-                    split_between=participants
-                ))
-            return expenses
+            # Get all expenses for the group in one query, with paidBy user
+            # info and the participants aggregated as JSON per row
+            cursor = self._conn.execute(
+                _SQL_GET_GROUP_EXPENSES,
+                (group_id,)
+            )
+            return [self._build_expense_from_row(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             raise StorageException(f"Database error retrieving group expenses: {e}") from e
 
-    def _get_expenses_with_payer_info(self, group_id):
+    def get_group_expenses_page(self, group_id, after=None, limit=20):
         """
-        Private helper to get all expenses for a group with payer user information.
+        Get one page of a group's expenses using keyset pagination.
+
+        Pages continue after the (expense_date, expense_id) of the last row
+        already seen, which the (group_id, expense_date, id) index serves as
+        a range scan - unlike OFFSET, no rows are scanned and discarded.
+
+        Args:
+            group_id: Group ID
+            after: Tuple of (expense_date, expense_id) from the last expense
+                of the previous page, or None for the first page
+            limit: Maximum number of expenses to return (default: 20)
+
+        Returns:
+            List of Expense objects with paidBy and splitBetween populated,
+            ordered by date then ID. Shorter than limit (possibly empty) on
+            the last page.
+
+        Raises:
+            StorageException: If a database error occurs
         """
-        cursor = self._conn.execute(
-            '''
-            SELECT e.id, e.group_id, e.description, e.amount, e.expense_date,
-                   payer.id as payer_id, payer.email as payer_email, payer.name as payer_name
-            FROM expenses e
-            INNER JOIN users payer ON e.paid_by_user_id = payer.id
-            WHERE e.group_id = ?
-            ORDER BY e.expense_date, e.id
-            ''',
-            (group_id,)
-        )
-        return cursor.fetchall()
+        # ('', -1) sorts before every real (date, id) pair, so the first page
+        # uses the same statement as the rest
+        after_date, after_id = after if after is not None else ('', -1)
+        try:
+            cursor = self._conn.execute(
+                _SQL_GET_GROUP_EXPENSES_PAGE,
+                (group_id, after_date, after_id, limit)
+            )
+            return [self._build_expense_from_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise StorageException(
+                f"Database error retrieving group expenses page: {e}"
+            ) from e
 
-    def _get_expense_participants(self, expense_id):
+    def _build_expense_from_row(self, row):
         """
-        Private helper to get all users who are participants in the given expense.
+        Private helper to build an Expense from a row with payer columns and
+        a JSON-aggregated participant array.
         """
-        participants_cursor = self._conn.execute(
-            '''
-            SELECT u.id, u.email, u.name
-            FROM expense_participants ep
-            INNER JOIN users u ON ep.user_id = u.id
-            WHERE ep.expense_id = ?
-            ORDER BY u.id
-            ''',
-            (expense_id,)
-        )
-        participant_rows = participants_cursor.fetchall()
-        return [
-            User(
-                id=participant_row['id'],
-                email=participant_row['email'],
-                name=participant_row['name']
-            )
-            for participant_row in participant_rows
+        # Decode the JSON participant array aggregated by the query
+        participants = [
+            User(id=user['id'], email=user['email'], name=user['name'])
+            for user in json.loads(row['participants_json'])
         ]
+        # Build paidBy user
+        payer = User(
+            id=row['payer_id'],
+            email=row['payer_email'],
+            name=row['payer_name']
+        )
+        # Build Expense object (per_person_amount is computed by the database
+        # as a generated column)
+        return Expense(
+            id=row['id'],
+            group_id=row['group_id'],
+            description=row['description'],
+            amount=float(row['amount']),
+            date=row['expense_date'],
+            paid_by=payer,
+            split_between=participants,
+            per_person_amount=float(row['per_person_amount'])
+        )
 
     def create_expense(self, expense):
         """
@@ -447,32 +657,22 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            # Insert expense (database enforces foreign key constraint on paid_by_user_id)
-            expense_id = self._insert_expense(expense)
-
-            # Add all participants
-            for user_id in expense.participant_user_ids:
-                self._add_expense_participant(expense_id, user_id)
-
-            self._conn.commit()
-
-            # Get payer user information (needed for return value)
-            # If insert succeeded, payer must exist (foreign key constraint enforced it)
-            payer = self.get_user_by_id(expense.paid_by_user_id)
-            # Get all participants
-            participants = self._get_expense_participants(expense_id)
-
-            return Expense(
-                id=expense_id,
-                group_id=expense.group_id,
-                description=expense.description,
-                amount=float(expense.amount),
-                date=expense.date,
-                paid_by=payer,
-                split_between=participants
-            )
+            with self._conn:
+                # Insert expense (database enforces foreign key constraint on
+                # paid_by_user_id)
+                expense_id = self._insert_expense(expense)
+
+                # Add all participants in one batched statement
+                self._conn.executemany(
+                    _SQL_ADD_EXPENSE_PARTICIPANT,
+                    [(expense_id, user_id)
+                     for user_id in expense.participant_user_ids]
+                )
+
+            # Read the expense back so the database-computed per_person_amount
+            # is included in the return value
+            return self.get_expense_by_id(expense_id)
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error creating expense: {e}") from e
 
     def _insert_expense(self, expense):
@@ -480,24 +680,46 @@ class DatabaseCostStorage: # pylint: disable=R0904
         Private helper to insert a new expense and return its id.
         """
         cursor = self._conn.execute(
-            ('INSERT INTO expenses (group_id, description, amount, expense_date, '
-             'paid_by_user_id) VALUES (?, ?, ?, ?, ?)'),
+            _SQL_INSERT_EXPENSE,
             (expense.group_id,
              expense.description,
              expense.amount,
              expense.date,
-             expense.paid_by_user_id)
+             expense.paid_by_user_id,
+             len(expense.participant_user_ids))
         )
         return cursor.lastrowid
 
-    def _add_expense_participant(self, expense_id, user_id):
+    def get_expense_group_and_payer(self, expense_id):
         """
-        Private helper to add a user as a participant to an expense.
+        Get just the group ID and payer user ID for an expense.
+
+        A lightweight authorization lookup - avoids materializing the payer
+        User and the participant list when the caller only needs to check
+        which group the expense belongs to and who paid.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (group_id, paid_by_user_id) if found, None otherwise
+
+        Raises:
+            StorageException: If a database error occurs
         """
-        self._conn.execute(
-            'INSERT INTO expense_participants (expense_id, user_id) VALUES (?, ?)',
-            (expense_id, user_id)
-        )
+        try:
+            cursor = self._conn.execute(
+                _SQL_GET_EXPENSE_GROUP_AND_PAYER,
+                (expense_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return (row['group_id'], row['paid_by_user_id'])
+        except sqlite3.Error as e:
+            raise StorageException(
+                f"Database error retrieving expense group and payer: {e}"
+            ) from e
 
     def get_expense_by_id(self, expense_id):
         """
@@ -515,34 +737,14 @@ class DatabaseCostStorage: # pylint: disable=R0904
         """
         try:
             cursor = self._conn.execute(
-                '''
-                SELECT e.id, e.group_id, e.description, e.amount, e.expense_date,
-                       payer.id as payer_id, payer.email as payer_email, payer.name as payer_name
-                FROM expenses e
-                INNER JOIN users payer ON e.paid_by_user_id = payer.id
-                WHERE e.id = ?
-                ''',
+                _SQL_GET_EXPENSE_BY_ID,
                 (expense_id,)
             )
             row = cursor.fetchone()
             if row is None:
                 return None
 
-            participants = self._get_expense_participants(expense_id)
-            payer = User(
-                id=row['payer_id'],
-                email=row['payer_email'],
-                name=row['payer_name']
-            )
-            return Expense(
-                id=row['id'],
-                group_id=row['group_id'],
-                description=row['description'],
-                amount=float(row['amount']),
-                date=row['expense_date'],
-                paid_by=payer,
-                split_between=participants
-            )
+            return self._build_expense_from_row(row)
         except sqlite3.Error as e:
             raise StorageException(
                 f"Database error retrieving expense by ID: {e}"
@@ -564,31 +766,30 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            # Update expense fields (paid_by_user_id is NOT updated)
-            self._conn.execute(
-                ('UPDATE expenses SET description = ?, amount = ?, expense_date = ? '
-                 'WHERE id = ?'),
-                (expense.description, expense.amount, expense.date, expense_id)
-            )
-
-            # Delete old participants
-            self._conn.execute(
-                'DELETE FROM expense_participants WHERE expense_id = ?',
-                (expense_id,)
-            )
+            with self._conn:
+                # Update expense fields (paid_by_user_id is NOT updated)
+                self._conn.execute(
+                    _SQL_UPDATE_EXPENSE,
+                    (expense.description, expense.amount, expense.date,
+                     len(expense.participant_user_ids), expense_id)
+                )
 
-            # Add new participants
-            for user_id in expense.participant_user_ids:
-                self._add_expense_participant(expense_id, user_id)
+                # Delete old participants
+                self._conn.execute(
+                    _SQL_DELETE_EXPENSE_PARTICIPANTS,
+                    (expense_id,)
+                )
 
-            self._conn.commit()
+                # Add new participants in one batched statement
+                self._conn.executemany(
+                    _SQL_ADD_EXPENSE_PARTICIPANT,
+                    [(expense_id, user_id)
+                     for user_id in expense.participant_user_ids]
+                )
 
             # Get updated expense with payer and participants
-            updated_expense = self.get_expense_by_id(expense_id)
-
-            return updated_expense
+            return self.get_expense_by_id(expense_id)
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error updating expense: {e}") from e
 
     def delete_expense(self, expense_id):
@@ -605,11 +806,10 @@ class DatabaseCostStorage: # pylint: disable=R0904
             StorageException: If a database error occurs
         """
         try:
-            self._conn.execute(
-                'DELETE FROM expenses WHERE id = ?',
-                (expense_id,)
-            )
-            self._conn.commit()
+            with self._conn:
+                self._conn.execute(
+                    _SQL_DELETE_EXPENSE,
+                    (expense_id,)
+                )
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise StorageException(f"Database error deleting expense: {e}") from e
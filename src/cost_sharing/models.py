@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+# Frozen because User instances are shared: the storage layer caches them and
+# hands the same object to every caller (see DatabaseCostStorage)
+@dataclass(slots=True, frozen=True)
 class User:
     """User model representing a user in the system"""
     id: int
@@ -14,7 +16,7 @@ class User:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """Group model representing a cost-sharing group"""
     id: int
@@ -25,7 +27,7 @@ class Group:
 
 
 # R0902 indicates too many instance variables but we need it to match the database schema
-@dataclass
+@dataclass(slots=True)
 class Expense:  # pylint: disable=R0902
     """Expense model representing an expense in a group"""
     id: int
@@ -38,14 +40,14 @@ class Expense:  # pylint: disable=R0902
     per_person_amount: float = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRequest:
     """Request Data Transfer Object for creating a new user"""
     email: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupRequest:
     """Request Data Transfer Object for creating a new group"""
     name: str
@@ -53,7 +55,7 @@ class GroupRequest:
     created_by_user_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpenseRequest:
     """Request Data Transfer Object for creating a new expense"""
     group_id: int
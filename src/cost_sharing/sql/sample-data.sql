@@ -5,6 +5,10 @@
 -- Enable foreign key constraints (required for SQLite)
 PRAGMA foreign_keys = ON;
 
+-- Load everything in one transaction so each INSERT doesn't pay its own
+-- implicit BEGIN/COMMIT under autocommit
+BEGIN TRANSACTION;
+
 -- ============================================================================
 -- USERS
 -- ============================================================================
@@ -77,30 +81,30 @@ INSERT INTO group_members (group_id, user_id) VALUES
 -- ============================================================================
 
 -- Group 2 Expenses
-INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id) VALUES
-(1, 2, 'Grocery shopping', 86.40, '2025-01-10', 3),
-(2, 2, 'Utilities bill', 120.00, '2025-01-15', 1),
-(3, 2, 'Restaurant dinner', 67.89, '2025-01-20', 4),
-(4, 2, 'Internet bill', 100.00, '2025-01-25', 1);
+INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id, participant_count) VALUES
+(1, 2, 'Grocery shopping', 86.40, '2025-01-10', 3, 2),
+(2, 2, 'Utilities bill', 120.00, '2025-01-15', 1, 2),
+(3, 2, 'Restaurant dinner', 67.89, '2025-01-20', 4, 2),
+(4, 2, 'Internet bill', 100.00, '2025-01-25', 1, 3);
 
 -- Group 3 Expenses
-INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id) VALUES
-(5, 3, 'Team lunch', 45.67, '2025-02-01', 5);
+INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id, participant_count) VALUES
+(5, 3, 'Team lunch', 45.67, '2025-02-01', 5, 2);
 
 -- Group 4 Expenses (large group with various split patterns)
-INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id) VALUES
-(6, 4, 'Textbooks', 250.00, '2025-02-05', 8),
-(7, 4, 'Coffee and snacks', 35.50, '2025-02-10', 9),
-(8, 4, 'Printing costs', 12.75, '2025-02-12', 10),
-(9, 4, 'Group dinner', 125.33, '2025-02-15', 11);
+INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id, participant_count) VALUES
+(6, 4, 'Textbooks', 250.00, '2025-02-05', 8, 5),
+(7, 4, 'Coffee and snacks', 35.50, '2025-02-10', 9, 3),
+(8, 4, 'Printing costs', 12.75, '2025-02-12', 10, 2),
+(9, 4, 'Group dinner', 125.33, '2025-02-15', 11, 5);
 
 -- Group 5 Expenses (group with null description)
-INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id) VALUES
-(10, 5, 'Quick expense', 25.00, '2025-02-20', 9);
+INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id, participant_count) VALUES
+(10, 5, 'Quick expense', 25.00, '2025-02-20', 9, 2);
 
 -- Group 6 Expenses (group with max length fields)
-INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id) VALUES
-(11, 6, 'This is an expense description that is exactly two hundred characters long to test the maximum length validation rule for expense descriptions in the system. It demonstrates proper handling of edge ca', 50.00, '2025-02-25', 10);
+INSERT INTO expenses (id, group_id, description, amount, expense_date, paid_by_user_id, participant_count) VALUES
+(11, 6, 'This is an expense description that is exactly two hundred characters long to test the maximum length validation rule for expense descriptions in the system. It demonstrates proper handling of edge ca', 50.00, '2025-02-25', 10, 2);
 
 -- ============================================================================
 -- EXPENSE PARTICIPANTS
@@ -169,3 +173,5 @@ INSERT INTO expense_participants (expense_id, user_id) VALUES
 (11, 10),
 (11, 11);
 
+
+COMMIT;
@@ -51,6 +51,11 @@ CREATE TABLE group_members (
 -- ============================================================================
 -- Stores expenses within groups. Each expense is paid by one user and
 -- split among multiple users (tracked in expense_participants table).
+--
+-- participant_count mirrors the number of rows in expense_participants and is
+-- maintained by the storage layer on insert/update. per_person_amount is a
+-- stored generated column computed by the database so the application never
+-- recalculates the split in Python.
 
 CREATE TABLE expenses (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,8 +64,12 @@ CREATE TABLE expenses (
     amount NUMERIC(10,2) NOT NULL,
     expense_date DATE NOT NULL,
     paid_by_user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE RESTRICT,
+    participant_count INTEGER NOT NULL,
+    per_person_amount NUMERIC(10,2) GENERATED ALWAYS AS
+        (ROUND(amount * 1.0 / participant_count, 2)) STORED,
     CHECK (amount >= 0.01),
-    CHECK (length(description) >= 1 AND length(description) <= 200)
+    CHECK (length(description) >= 1 AND length(description) <= 200),
+    CHECK (participant_count >= 1)
 );
 
 -- ============================================================================
@@ -74,3 +83,20 @@ CREATE TABLE expense_participants (
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE RESTRICT,
     PRIMARY KEY (expense_id, user_id)
 );
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+-- Lookups by group_id are covered by the junction-table primary keys; these
+-- indexes cover the remaining hot access paths (groups by member, expenses by
+-- group and by payer). users.email is already indexed via its UNIQUE
+-- constraint.
+--
+-- The composite indexes are covering for their queries: (user_id, group_id)
+-- answers "which groups is this user in" from the index alone, and
+-- (group_id, expense_date, id) makes get_group_expenses' WHERE + ORDER BY a
+-- single index range scan with no sort step.
+
+CREATE INDEX idx_group_members_user ON group_members(user_id, group_id);
+CREATE INDEX idx_expenses_group_date ON expenses(group_id, expense_date, id);
+CREATE INDEX idx_expenses_payer ON expenses(paid_by_user_id);
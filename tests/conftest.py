@@ -10,6 +10,10 @@ Fixtures:
 - app_empty_db: CostSharing application layer with empty database
 - app_with_sample_data: CostSharing application layer with sample data loaded
 
+The sample database is built once per session and serialized to a binary
+snapshot (sample_data_blob fixture); each test deserializes the snapshot into
+a fresh connection instead of re-executing the SQL scripts.
+
 The sample data is defined in src/cost_sharing/sql/sample-data.sql and documented in
 docs/sample-dataset.md. Test helpers in tests/helpers.py provide assertion functions
 that reference this sample data.
@@ -22,53 +26,82 @@ from cost_sharing.db_storage import DatabaseCostStorage
 from cost_sharing.cost_sharing import CostSharing
 
 
-def execute_sql_file(connection, sql_path):
-    """
-    Execute SQL statements from a file.
-    
-    Args:
-        connection: sqlite3.Connection to execute SQL against
-        sql_path: Path to SQL file to execute (string or pathlib.Path)
-    """
-    with open(sql_path, 'r', encoding='utf-8') as f:
-        sql_content = f.read()
-
-    connection.executescript(sql_content)
+# SQL script text, read once at import. The schema is executed for every test
+# that uses the empty-database fixtures and the files never change during a
+# run, so there is no reason to re-read them from disk per test.
+_SQL_DIR = importlib.resources.files('cost_sharing') / 'sql'
+_SCHEMA_SQL = (_SQL_DIR / 'schema-sqlite.sql').read_text(encoding='utf-8')
+_SAMPLE_DATA_SQL = (_SQL_DIR / 'sample-data.sql').read_text(encoding='utf-8')
 
 
 # ============================================================================
 # Database Connection Fixtures (Chained)
 # ============================================================================
 
+@pytest.fixture(name='schema_blob', scope='session')
+def create_schema_blob():
+    """
+    Session-scoped fixture: Build the empty (schema-only) database once and
+    serialize it to a binary snapshot, so per-test setup is a byte copy
+    instead of re-running the schema DDL through the SQL parser.
+    """
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(_SCHEMA_SQL)
+    blob = conn.serialize()
+    conn.close()
+    return blob
+
+
 @pytest.fixture(name='db_connection')
-def create_db_connection():
+def create_db_connection(schema_blob):
     """
-    Base fixture: Create an in-memory SQLite database connection with schema loaded.
+    Base fixture: Create an in-memory SQLite database connection with schema
+    loaded from the session-scoped binary snapshot.
     The connection is properly closed when the fixture tears down.
     """
     conn = sqlite3.connect(':memory:')
+    conn.deserialize(schema_blob)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA foreign_keys = ON')
 
-    # Load schema
-    schema_path = importlib.resources.files('cost_sharing') / 'sql' / 'schema-sqlite.sql'
-    execute_sql_file(conn, schema_path)
-
     yield conn
 
     # Close connection during fixture teardown
     conn.close()
 
 
+@pytest.fixture(name='sample_data_blob', scope='session')
+def create_sample_data_blob():
+    """
+    Session-scoped fixture: Build the sample database once and serialize it to
+    a binary snapshot. Executing schema-sqlite.sql and sample-data.sql through
+    the SQL parser happens a single time per session; each test then loads the
+    snapshot as a raw byte copy instead of re-parsing the SQL.
+    """
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(_SCHEMA_SQL)
+    conn.executescript(_SAMPLE_DATA_SQL)
+    blob = conn.serialize()
+    conn.close()
+    return blob
+
+
 @pytest.fixture(name='db_connection_with_data')
-def create_db_connection_with_data(db_connection):
+def create_db_connection_with_data(sample_data_blob):
     """
-    Load sample data into the database connection.
-    Depends on db_connection fixture (which already has schema loaded).
+    Create an in-memory SQLite database connection with schema and sample data
+    loaded from the session-scoped binary snapshot.
+    The connection is properly closed when the fixture tears down.
     """
-    sample_data_path = importlib.resources.files('cost_sharing') / 'sql' / 'sample-data.sql'
-    execute_sql_file(db_connection, sample_data_path)
-    yield db_connection
+    conn = sqlite3.connect(':memory:')
+    conn.deserialize(sample_data_blob)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+
+    yield conn
+
+    # Close connection during fixture teardown
+    conn.close()
 
 
 # ============================================================================
@@ -218,6 +218,19 @@ SAMPLE_GROUP_MEMBERS = {
     6: [10, 11],  # Max length group: Jack, Kate
 }
 
+# Pre-sorted copies of the relationship tables, computed once at import so the
+# assertion helpers below don't re-sort the expected IDs on every call (the
+# helpers run hundreds of times per test session). Stored as tuples - tuple
+# equality short-circuits on length before comparing elements.
+_SORTED_EXPENSE_PARTICIPANTS = {
+    expense_id: tuple(sorted(user_ids))
+    for expense_id, user_ids in SAMPLE_EXPENSE_PARTICIPANTS.items()
+}
+_SORTED_GROUP_MEMBERS = {
+    group_id: tuple(sorted(user_ids))
+    for group_id, user_ids in SAMPLE_GROUP_MEMBERS.items()
+}
+
 
 def assert_user_is(user, user_key):
     """
@@ -306,8 +319,8 @@ def assert_group_is(group, group_key):  # pylint: disable=R0914
         f"Expected creator ID {expected_creator_id}, got {group.created_by.id}"
 
     # Check that all expected members are present
-    expected_member_ids = sorted(SAMPLE_GROUP_MEMBERS[group.id])
-    actual_member_ids = sorted([member.id for member in group.members])
+    expected_member_ids = _SORTED_GROUP_MEMBERS[group.id]
+    actual_member_ids = tuple(sorted(member.id for member in group.members))
     assert actual_member_ids == expected_member_ids, \
         f"Expected member IDs {expected_member_ids}, got {actual_member_ids}"
 
@@ -351,9 +364,8 @@ def assert_expense_is(expense, expense_key):
         f"Expected paid_by user ID {expected['paid_by_user_id']}, got {expense.paid_by.id}"
 
     # Check split_between participants
-    expected_participants = SAMPLE_EXPENSE_PARTICIPANTS[expected["id"]]
-    actual_participant_ids = sorted([user.id for user in expense.split_between])
-    expected_participant_ids = sorted(expected_participants)
+    expected_participant_ids = _SORTED_EXPENSE_PARTICIPANTS[expected["id"]]
+    actual_participant_ids = tuple(sorted(user.id for user in expense.split_between))
     assert actual_participant_ids == expected_participant_ids, \
         f"Expected splitBetween user IDs {expected_participant_ids}, got {actual_participant_ids}"
 
@@ -381,8 +393,8 @@ def assert_expense_participants(expense, expected_user_ids):
         expense: Expense object to check
         expected_user_ids: List of expected user IDs in split_between
     """
-    actual_user_ids = sorted([user.id for user in expense.split_between])
-    expected_sorted = sorted(expected_user_ids)
+    actual_user_ids = tuple(sorted(user.id for user in expense.split_between))
+    expected_sorted = tuple(sorted(expected_user_ids))
     assert actual_user_ids == expected_sorted, \
         f"Expected splitBetween user IDs {expected_sorted}, got {actual_user_ids}"
 
@@ -439,7 +451,7 @@ def assert_expense_matches_retrieved(created_expense, expenses_list):
         (f"Split between mismatch: {created_participant_ids} vs "
          f"{retrieved_participant_ids}")
 
-    # Verify per_person_amount (should both be None in storage layer)
+    # Verify per_person_amount (computed by the database as a generated column)
     assert matching_expense.per_person_amount == created_expense.per_person_amount, \
         (f"Per person amount mismatch: {created_expense.per_person_amount} vs "
          f"{matching_expense.per_person_amount}")
@@ -453,8 +465,8 @@ def assert_group_members(group_id, actual_member_ids):
         group_id: Group ID to check
         actual_member_ids: List of actual member user IDs
     """
-    expected_member_ids = sorted(SAMPLE_GROUP_MEMBERS[group_id])
-    actual_sorted = sorted(actual_member_ids)
+    expected_member_ids = _SORTED_GROUP_MEMBERS[group_id]
+    actual_sorted = tuple(sorted(actual_member_ids))
     assert actual_sorted == expected_member_ids, \
         f"Expected group {group_id} members {expected_member_ids}, got {actual_sorted}"
 
@@ -467,8 +479,8 @@ def assert_group_has_members(group, expected_member_ids):
         group: Group object to check
         expected_member_ids: List of expected member user IDs
     """
-    actual_member_ids = sorted([member.id for member in group.members])
-    expected_sorted = sorted(expected_member_ids)
+    actual_member_ids = tuple(sorted(member.id for member in group.members))
+    expected_sorted = tuple(sorted(expected_member_ids))
     assert actual_member_ids == expected_sorted, \
         f"Expected group {group.id} members {expected_sorted}, got {actual_member_ids}"
 
@@ -547,8 +559,8 @@ def assert_group_json_is(group_json, group_key):  # pylint: disable=R0914
         f"Expected creator ID {expected_creator_id}, got {group_json['createdBy'].get('id')}"
 
     # Check that all expected members are present
-    expected_member_ids = sorted(SAMPLE_GROUP_MEMBERS[group_json['id']])
-    actual_member_ids = sorted([member['id'] for member in group_json['members']])
+    expected_member_ids = _SORTED_GROUP_MEMBERS[group_json['id']]
+    actual_member_ids = tuple(sorted(member['id'] for member in group_json['members']))
     assert actual_member_ids == expected_member_ids, \
         f"Expected member IDs {expected_member_ids}, got {actual_member_ids}"
 
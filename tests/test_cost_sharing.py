@@ -10,6 +10,7 @@ in docs/sample-dataset.md. Helper functions from tests/helpers.py are used for
 assertions (e.g., assert_user_is, assert_groups_are).
 """
 
+from unittest.mock import MagicMock
 import pytest
 from helpers import (
     assert_user_is, assert_user_matches, assert_groups_are,
@@ -18,6 +19,7 @@ from helpers import (
     SAMPLE_USER_REQUESTS,
     TEST_USER_REQUESTS, TEST_EXPENSE_REQUESTS
 )
+from cost_sharing.cost_sharing import CostSharing
 from cost_sharing.models import UserRequest, GroupRequest
 from cost_sharing.exceptions import (
     UserNotFoundError, GroupNotFoundError, ForbiddenError, ConflictError,
@@ -179,6 +181,38 @@ def test_get_group_by_id_handles_empty_description(app_with_sample_data):
     assert_group_is(group, "quick_split")
 
 
+def test_update_expense_reuses_cached_group_within_request(db_storage_with_sample_data):
+    """Test repeated group authorization within one request hits storage only once"""
+    storage = db_storage_with_sample_data
+
+    # Wrap get_group_by_id so we can count storage fetches
+    storage.get_group_by_id = MagicMock(side_effect=storage.get_group_by_id)
+    app = CostSharing(storage)
+
+    # update_expense authorizes the caller and later re-reads the group for
+    # participant validation - the second read must come from the cache
+    app.update_expense(2, 2, 1, TEST_EXPENSE_REQUESTS["updated_utilities_bill"])
+
+    assert storage.get_group_by_id.call_count == 1
+
+
+def test_group_cache_cleared_between_requests(db_storage_with_sample_data):
+    """Test group cache does not leak between requests (each request refetches)"""
+    storage = db_storage_with_sample_data
+
+    # Wrap get_group_by_id so we can count storage fetches
+    storage.get_group_by_id = MagicMock(side_effect=storage.get_group_by_id)
+    app = CostSharing(storage)
+
+    group = app.get_group_by_id(2, 1)
+    assert_group_is(group, "roommates")
+    group = app.get_group_by_id(2, 1)
+    assert_group_is(group, "roommates")
+
+    # Two separate requests means two storage fetches - no stale cache reuse
+    assert storage.get_group_by_id.call_count == 2
+
+
 # ============================================================================
 # add_group_member Tests
 # ============================================================================
@@ -205,12 +239,12 @@ def test_add_group_member_creator_adds_new_user(app_with_sample_data):
     # Add a new user that doesn't exist
     group = app.add_group_member(1, 1, TEST_USER_REQUESTS["new_user"])
 
-    # Verify group now has the new member
-    member_ids = [member.id for member in group.members]
-    assert 1 in member_ids  # Alice
-    assert 2 in member_ids  # Bob
+    # Verify group now has the new member (single membership lookups instead
+    # of materializing the member list)
+    assert app.group_has_member(1, 1)  # Alice
+    assert app.group_has_member(1, 2)  # Bob
     # New user should have ID 12 (after 11 sample users)
-    assert 12 in member_ids
+    assert app.group_has_member(1, 12)
     assert len(group.members) == 3
 
     # Verify the new user was created
@@ -263,6 +297,22 @@ def test_add_group_member_raises_conflict_error_for_duplicate_member(app_with_sa
     assert "User is already a member of this group" in str(exc_info.value)
 
 
+# ============================================================================
+# group_has_member Tests
+# ============================================================================
+
+def test_group_has_member_returns_true_for_member(app_with_sample_data):
+    """Test group_has_member returns True when user is a member"""
+    # Group 2 has members [3, 1, 4] (Charlie, Alice, David) from sample data
+    assert app_with_sample_data.group_has_member(2, 1) is True
+
+
+def test_group_has_member_returns_false_for_non_member(app_with_sample_data):
+    """Test group_has_member returns False when user is not a member"""
+    # User 2 (Bob) is not a member of group 2
+    assert app_with_sample_data.group_has_member(2, 2) is False
+
+
 # ============================================================================
 # remove_group_member Tests
 # ============================================================================
@@ -11,7 +11,6 @@ assertions (e.g., assert_user_matches, assert_groups_are).
 """
 
 import sqlite3
-from unittest.mock import MagicMock
 import pytest
 from helpers import (
     assert_user_matches, assert_groups_are,
@@ -69,6 +68,40 @@ def test_create_user_auto_increments_ids_for_multiple_users(empty_db_storage):
     assert user3.id == 3
 
 
+def test_create_users_creates_batch_with_sequential_ids(empty_db_storage):
+    """Test create_users creates every user in the batch with auto-incremented IDs"""
+    users = empty_db_storage.create_users([
+        TEST_USER_REQUESTS["user1"],
+        TEST_USER_REQUESTS["user2"],
+        TEST_USER_REQUESTS["user3"],
+    ])
+
+    assert_user_matches(users[0], 1, "user1@example.com", "User One")
+    assert_user_matches(users[1], 2, "user2@example.com", "User Two")
+    assert_user_matches(users[2], 3, "user3@example.com", "User Three")
+
+    # All three were persisted
+    assert_user_matches(
+        empty_db_storage.get_user_by_email("user2@example.com"),
+        2, "user2@example.com", "User Two")
+
+
+def test_create_users_rolls_back_whole_batch_on_error(empty_db_storage):
+    """Test create_users rolls back all inserts when one fails"""
+    empty_db_storage.create_user(TEST_USER_REQUESTS["test_user"])
+
+    # "another_user" reuses test_user's email, so the batch fails partway
+    with pytest.raises(StorageException) as exc_info:
+        empty_db_storage.create_users([
+            TEST_USER_REQUESTS["user1"],
+            TEST_USER_REQUESTS["another_user"],
+        ])
+    assert "Database error creating users" in str(exc_info.value)
+
+    # user1 was not created (the batch is atomic)
+    assert empty_db_storage.get_user_by_email("user1@example.com") is None
+
+
 def test_get_user_by_id_returns_user_when_exists(empty_db_storage):
     """Test get_user_by_id retrieves user and all fields are correct"""
     created_user = empty_db_storage.create_user(TEST_USER_REQUESTS["test_user"])
@@ -88,39 +121,97 @@ def test_get_user_by_id_returns_none_when_not_exists(empty_db_storage):
     assert user is None
 
 
-@pytest.fixture(name='error_storage')
-def create_error_storage():
-    """
-    Create a DatabaseCostStorage instance that raises errors.
-    """
-    mock_conn = MagicMock()
-    storage = DatabaseCostStorage(mock_conn)
-    mock_conn.execute = MagicMock(side_effect=sqlite3.Error("Mock database error"))
-    return storage
+def test_get_user_by_id_serves_repeat_lookups_from_cache(db_storage_with_sample_data):
+    """Test repeated get_user_by_id lookups return the cached User object"""
+    storage = db_storage_with_sample_data
+    first = storage.get_user_by_id(1)
+    # Users are immutable, so the second lookup is the identical cached object
+    assert storage.get_user_by_id(1) is first
 
 
-def test_get_user_by_email_raises_storage_exception_on_database_error(error_storage):
-    """Test get_user_by_email raises StorageException when database error occurs"""
-    storage = error_storage
+def test_get_user_by_email_serves_repeat_lookups_from_cache(db_storage_with_sample_data):
+    """Test repeated get_user_by_email lookups return the cached User object"""
+    storage = db_storage_with_sample_data
+    first = storage.get_user_by_email("alice@school.edu")
+    assert storage.get_user_by_email("alice@school.edu") is first
+    # The ID cache is populated by the same lookup
+    assert storage.get_user_by_id(first.id) is first
 
-    with pytest.raises(StorageException):
-        storage.get_user_by_email("test@example.com")
 
+def test_create_user_populates_the_lookup_cache(empty_db_storage):
+    """Test a created user is served from the cache by both lookups"""
+    created_user = empty_db_storage.create_user(TEST_USER_REQUESTS["test_user"])
+    assert empty_db_storage.get_user_by_id(created_user.id) is created_user
+    assert empty_db_storage.get_user_by_email("test@example.com") is created_user
 
-def test_create_user_raises_storage_exception_on_database_error(error_storage):
-    """Test create_user raises StorageException when database error occurs"""
-    storage = error_storage
 
-    with pytest.raises(StorageException):
-        storage.create_user(TEST_USER_REQUESTS["test_user"])
+# Module-scoped: the storage has no per-test state (every test just calls one
+# method and expects it to raise), so one instance serves the whole module.
+@pytest.fixture(name='error_storage', scope='module')
+def create_error_storage():
+    """
+    Create a DatabaseCostStorage instance that raises errors.
 
+    Backed by a connection that is closed after construction: every execute
+    raises sqlite3.ProgrammingError (a sqlite3.Error subclass) at C level,
+    without MagicMock's per-call attribute and call-recording overhead.
+    """
+    conn = sqlite3.connect(':memory:')
+    storage = DatabaseCostStorage(conn)
+    conn.close()
+    return storage
 
-def test_get_user_by_id_raises_storage_exception_on_database_error(error_storage):
-    """Test get_user_by_id raises StorageException when database error occurs"""
-    storage = error_storage
 
-    with pytest.raises(StorageException):
-        storage.get_user_by_id(1)
+# One parametrized test covers the near-identical "wraps database errors in
+# StorageException" behavior of every storage method, instead of one test
+# function (with its own fixture setup/teardown) per method.
+# create_group keeps its standalone test below with the other create_group
+# tests.
+@pytest.mark.parametrize("call,expected_message", [
+    (lambda s: s.get_user_by_email("test@example.com"),
+     "Database error retrieving user by email"),
+    (lambda s: s.create_user(TEST_USER_REQUESTS["test_user"]),
+     "Database error creating user"),
+    (lambda s: s.get_user_by_id(1),
+     "Database error retrieving user by ID"),
+    (lambda s: s.get_user_groups(1),
+     "Database error retrieving user groups"),
+    (lambda s: s.get_group_by_id(1),
+     "Database error retrieving group by ID"),
+    (lambda s: s.is_member(1, 1),
+     "Database error checking membership"),
+    (lambda s: s.add_group_member(1, 1),
+     "Database error adding member"),
+    (lambda s: s.delete_group_member(1, 1),
+     "Database error deleting member"),
+    (lambda s: s.delete_group(1),
+     "Database error deleting group"),
+    (lambda s: s.get_group_expenses(1),
+     "Database error retrieving group expenses"),
+    (lambda s: s.get_group_expenses_page(1),
+     "Database error retrieving group expenses page"),
+    (lambda s: s.create_expense(TEST_EXPENSE_REQUESTS["test_failure"]),
+     "Database error creating expense"),
+    (lambda s: s.get_expense_by_id(1),
+     "Database error retrieving expense by ID"),
+    (lambda s: s.get_expense_group_and_payer(1),
+     "Database error retrieving expense group and payer"),
+    (lambda s: s.update_expense(1, TEST_EXPENSE_REQUESTS["test_expense_group1"]),
+     "Database error updating expense"),
+    (lambda s: s.delete_expense(1),
+     "Database error deleting expense"),
+], ids=[
+    "get_user_by_email", "create_user", "get_user_by_id", "get_user_groups",
+    "get_group_by_id", "is_member", "add_group_member", "delete_group_member",
+    "delete_group", "get_group_expenses", "get_group_expenses_page",
+    "create_expense", "get_expense_by_id",
+    "get_expense_group_and_payer", "update_expense", "delete_expense",
+])
+def test_raises_storage_exception_on_database_error(error_storage, call, expected_message):
+    """Test each storage method wraps database errors in StorageException"""
+    with pytest.raises(StorageException) as exc_info:
+        call(error_storage)
+    assert expected_message in str(exc_info.value)
 
 
 # ============================================================================
@@ -145,14 +236,6 @@ def test_get_user_groups_returns_multiple_groups(db_storage_with_sample_data):
     assert_groups_are(groups, ["weekend_trip", "roommates"])
 
 
-def test_get_user_groups_raises_storage_exception_on_database_error(error_storage):
-    """Test get_user_groups raises StorageException when database error occurs"""
-    storage = error_storage
-
-    with pytest.raises(StorageException):
-        storage.get_user_groups(1)
-
-
 # ============================================================================
 # create_group Tests
 # ============================================================================
@@ -232,13 +315,6 @@ def test_create_group_raises_storage_exception_on_database_error(error_storage):
     """Test create_group raises StorageException when database error occurs during insert"""
     storage = error_storage
 
-    # This test exists to cover the except block in create_group, but we have to get past
-    # the get_user_by_id check.  This is a hack.  We need get_user_by_id to return a "User"
-    # so that we get past that check. I made it return a dict because I don't want to import
-    # the User model just for this test.
-    storage.get_user_by_id = MagicMock(return_value={"id":1,
-    "email":"test@example.com", "name":"Test User"})
-
     with pytest.raises(StorageException) as exc_info:
         group_request = GroupRequest(
             name="Test Group",
@@ -276,15 +352,6 @@ def test_get_group_by_id_handles_empty_description(db_storage_with_sample_data):
     assert_group_is(group, "quick_split")
 
 
-def test_get_group_by_id_raises_storage_exception_on_database_error(error_storage):
-    """Test get_group_by_id raises StorageException when database error occurs (lines 282-283)"""
-    storage = error_storage
-
-    with pytest.raises(StorageException) as exc_info:
-        storage.get_group_by_id(1)
-    assert "Database error retrieving group by ID" in str(exc_info.value)
-
-
 # ============================================================================
 # add_group_member Tests
 # ============================================================================
@@ -334,13 +401,55 @@ def test_add_group_member_fails_for_duplicate_member(db_storage_with_sample_data
     assert "Database error adding member" in str(exc_info.value)
 
 
-def test_add_group_member_fails_on_database_error(error_storage):
-    """Test add_group_member raises StorageException when database error occurs"""
-    storage = error_storage
+# ============================================================================
+# add_group_members Tests
+# ============================================================================
+
+def test_add_group_members_adds_all_members(db_storage_with_sample_data):
+    """Test add_group_members adds every user in the batch to the group"""
+    storage = db_storage_with_sample_data
+
+    # Group 1 has members [1, 2] (Alice, Bob) from sample data
+    result = storage.add_group_members(1, [3, 4, 5])
+    assert result is True
+
+    group = storage.get_group_by_id(1)
+    assert_group_has_members(group, [1, 2, 3, 4, 5])
+
+
+def test_add_group_members_rolls_back_whole_batch_on_error(db_storage_with_sample_data):
+    """Test add_group_members rolls back all inserts when one fails"""
+    storage = db_storage_with_sample_data
 
+    # User 2 (Bob) is already a member of group 1, so the batch fails partway
     with pytest.raises(StorageException) as exc_info:
-        storage.add_group_member(1, 1)
-    assert "Database error adding member" in str(exc_info.value)
+        storage.add_group_members(1, [3, 2, 4])
+    assert "Database error adding members" in str(exc_info.value)
+
+    # Neither user 3 nor user 4 was added (the batch is atomic)
+    group = storage.get_group_by_id(1)
+    assert_group_has_members(group, [1, 2])
+
+
+# ============================================================================
+# is_member Tests
+# ============================================================================
+
+def test_is_member_returns_true_for_member(db_storage_with_sample_data):
+    """Test is_member returns True when user is a member of the group"""
+    # Group 2 has members [3, 1, 4] (Charlie, Alice, David) from sample data
+    assert db_storage_with_sample_data.is_member(2, 1) is True
+
+
+def test_is_member_returns_false_for_non_member(db_storage_with_sample_data):
+    """Test is_member returns False when user is not a member of the group"""
+    # User 2 (Bob) is not a member of group 2
+    assert db_storage_with_sample_data.is_member(2, 2) is False
+
+
+def test_is_member_returns_false_for_nonexistent_group(db_storage_with_sample_data):
+    """Test is_member returns False when group doesn't exist"""
+    assert db_storage_with_sample_data.is_member(999, 1) is False
 
 
 # ============================================================================
@@ -381,15 +490,6 @@ def test_delete_group_member_succeeds_for_nonexistent_group(db_storage_with_samp
     storage.delete_group_member(999, 1)
 
 
-def test_delete_group_member_fails_on_database_error(error_storage):
-    """Test delete_group_member raises StorageException when database error occurs"""
-    storage = error_storage
-
-    with pytest.raises(StorageException) as exc_info:
-        storage.delete_group_member(1, 1)
-    assert "Database error deleting member" in str(exc_info.value)
-
-
 # ============================================================================
 # delete_group Tests
 # ============================================================================
@@ -414,15 +514,6 @@ def test_delete_group_succeeds_when_group_not_found(db_storage_with_sample_data)
     storage.delete_group(999)
 
 
-def test_delete_group_raises_storage_exception_on_database_error(error_storage):
-    """Test delete_group raises StorageException on database error"""
-    storage = error_storage
-
-    with pytest.raises(StorageException) as exc_info:
-        storage.delete_group(1)
-    assert "Database error deleting group" in str(exc_info.value)
-
-
 # ============================================================================
 # get_group_expenses Tests
 # ============================================================================
@@ -486,14 +577,18 @@ def test_get_group_expenses_includes_split_between_participants(db_storage_with_
     assert_expense_participants(expenses[3], [3, 1, 4])
 
 
-def test_get_group_expenses_has_per_person_amount_as_none(db_storage_with_sample_data):
-    """Test get_group_expenses returns expenses with per_person_amount as None"""
+def test_get_group_expenses_includes_per_person_amount(db_storage_with_sample_data):
+    """Test get_group_expenses returns database-computed per_person_amount"""
     storage = db_storage_with_sample_data
     expenses = storage.get_group_expenses(2)
 
-    # All expenses should have per_person_amount as None from storage layer
-    for expense in expenses:
-        assert expense.per_person_amount is None
+    # per_person_amount is a generated column computed by the database
+    # Grocery shopping: $86.40 / 2, Utilities bill: $120.00 / 2,
+    # Restaurant dinner: $67.89 / 2, Internet bill: $100.00 / 3
+    assert expenses[0].per_person_amount == 43.20
+    assert expenses[1].per_person_amount == 60.00
+    assert expenses[2].per_person_amount == 33.95
+    assert expenses[3].per_person_amount == 33.33
 
 
 def test_get_group_expenses_orders_by_date_then_id(db_storage_with_sample_data):
@@ -530,13 +625,43 @@ def test_get_group_expenses_with_many_participants(db_storage_with_sample_data):
     assert_expense_participants(textbooks_expense, [8, 9, 10, 11, 2])
 
 
-def test_get_group_expenses_raises_storage_exception_on_database_error(error_storage):
-    """Test get_group_expenses raises StorageException when database error occurs"""
-    storage = error_storage
+# ============================================================================
+# get_group_expenses_page Tests
+# ============================================================================
 
-    with pytest.raises(StorageException) as exc_info:
-        storage.get_group_expenses(1)
-    assert "Database error retrieving group expenses" in str(exc_info.value)
+def test_get_group_expenses_page_returns_first_page(db_storage_with_sample_data):
+    """Test get_group_expenses_page returns the first page when after is None"""
+    storage = db_storage_with_sample_data
+    # Group 2 has expenses 1-4 ordered by date
+    expenses = storage.get_group_expenses_page(2, limit=2)
+    assert_expenses_are(expenses, ["grocery_shopping", "utilities_bill"])
+
+
+def test_get_group_expenses_page_continues_after_cursor(db_storage_with_sample_data):
+    """Test get_group_expenses_page continues after the given (date, id) cursor"""
+    storage = db_storage_with_sample_data
+
+    first_page = storage.get_group_expenses_page(2, limit=2)
+    last = first_page[-1]
+    second_page = storage.get_group_expenses_page(2, after=(last.date, last.id), limit=2)
+    assert_expenses_are(second_page, ["restaurant_dinner", "internet_bill"])
+
+
+def test_get_group_expenses_page_returns_empty_after_last_row(db_storage_with_sample_data):
+    """Test get_group_expenses_page returns empty list past the last expense"""
+    storage = db_storage_with_sample_data
+    expenses = storage.get_group_expenses_page(2, after=('2025-01-25', 4))
+    assert expenses == []
+
+
+def test_get_group_expenses_page_limit_covers_all(db_storage_with_sample_data):
+    """Test get_group_expenses_page returns everything when limit is large enough"""
+    storage = db_storage_with_sample_data
+    expenses = storage.get_group_expenses_page(2)
+    assert_expenses_are(
+        expenses,
+        ["grocery_shopping", "utilities_bill", "restaurant_dinner", "internet_bill"]
+    )
 
 
 # ============================================================================
@@ -609,21 +734,6 @@ def test_create_expense_raises_storage_exception_when_payer_not_found(
     assert "Database error creating expense" in str(exc_info.value)
 
 
-def test_create_expense_raises_storage_exception_on_database_error(error_storage):
-    """Test create_expense raises StorageException when database error occurs"""
-    storage = error_storage
-
-    # Mock get_user_by_id to return a user so we get past that check
-    storage.get_user_by_id = MagicMock(
-        return_value={"id": 1, "email": "test@example.com", "name": "Test User"}
-    )
-
-    with pytest.raises(StorageException) as exc_info:
-        expense_request = TEST_EXPENSE_REQUESTS["test_failure"]
-        storage.create_expense(expense_request)
-    assert "Database error creating expense" in str(exc_info.value)
-
-
 # ============================================================================
 # get_expense_by_id Tests
 # ============================================================================
@@ -648,11 +758,21 @@ def test_get_expense_by_id_returns_none_when_not_exists(empty_db_storage):
     assert expense is None
 
 
-def test_get_expense_by_id_raises_storage_exception_on_database_error(error_storage):
-    """Test get_expense_by_id raises StorageException on database error"""
-    with pytest.raises(StorageException,
-                      match="Database error retrieving expense by ID"):
-        error_storage.get_expense_by_id(1)
+# ============================================================================
+# get_expense_group_and_payer Tests
+# ============================================================================
+
+def test_get_expense_group_and_payer_returns_ids(db_storage_with_sample_data):
+    """Test get_expense_group_and_payer returns the group and payer IDs"""
+    # Expense 1 (grocery_shopping) is in group 2 and was paid by Charlie (3)
+    info = db_storage_with_sample_data.get_expense_group_and_payer(1)
+    assert info == (2, 3)
+
+
+def test_get_expense_group_and_payer_returns_none_when_not_exists(empty_db_storage):
+    """Test get_expense_group_and_payer returns None when expense doesn't exist"""
+    info = empty_db_storage.get_expense_group_and_payer(999)
+    assert info is None
 
 
 # ============================================================================
@@ -706,16 +826,6 @@ def test_update_expense_keeps_payer_unchanged(db_storage_with_sample_data):
     assert_user_is(updated_expense.paid_by, "alice")
 
 
-def test_update_expense_raises_storage_exception_on_database_error(error_storage):
-    """Test update_expense raises StorageException on database error"""
-
-    expense_request = TEST_EXPENSE_REQUESTS["test_expense_group1"]
-
-    with pytest.raises(StorageException,
-                      match="Database error updating expense"):
-        error_storage.update_expense(1, expense_request)
-
-
 # ============================================================================
 # delete_expense Tests
 # ============================================================================
@@ -755,10 +865,3 @@ def test_delete_expense_from_group_with_multiple_expenses(db_storage_with_sample
     assert 2 in expense_ids
     assert 3 not in expense_ids
     assert 4 in expense_ids
-
-
-def test_delete_expense_raises_storage_exception_on_database_error(error_storage):
-    """Test delete_expense raises StorageException on database error"""
-    with pytest.raises(StorageException,
-                      match="Database error deleting expense"):
-        error_storage.delete_expense(1)
@@ -4,7 +4,9 @@ import pytest
 from cost_sharing.oauth_handler import OAuthHandler, TokenExpiredError, TokenInvalidError
 
 
-@pytest.fixture(name='handler')
+# Module-scoped: the handler holds only immutable configuration, so one
+# instance (and one client-config build) serves every test in this module
+@pytest.fixture(name='handler', scope='module')
 def create_handler():
     """Fixture for OAuthHandler"""
     return OAuthHandler(